@@ -9,58 +9,332 @@ Features:
 - Configurable paths and settings
 """
 
+import asyncio
+import base64
+import io
 import os
+import queue
+import shlex
 import sys
 import threading
-import time
 import subprocess
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import json
+from collections import OrderedDict
 from datetime import datetime
 
-# Third-party imports (install with: pip install watchdog pystray pillow)
+# Third-party packages are imported lazily (watchdog when monitoring starts,
+# pystray/PIL when the tray icon is created) so the GUI appears faster and
+# baseline memory stays low. Verify they are installed up front so a missing
+# package still fails at startup rather than mid-session.
+def _check_deps():
+    """Fail fast if required packages are missing, without importing them"""
+    import importlib.util
+    missing = [name for name in ('watchdog', 'pystray', 'PIL')
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Missing required packages. Please install with:")
+        print("pip install watchdog pystray pillow")
+        sys.exit(1)
+
+
+_check_deps()
+
+# Optional: in-process git via libgit2 (pip install pygit2). When present,
+# read-heavy operations skip spawning the git binary entirely.
 try:
-    from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
-    import pystray
-    from PIL import Image, ImageDraw
-except ImportError as e:
-    print(f"Missing required packages. Please install with:")
-    print("pip install watchdog pystray pillow")
-    sys.exit(1)
-
-
-class FileExtensionHandler(FileSystemEventHandler):
-    """Handles file change events for specified extension"""
-    
-    def __init__(self, app):
-        self.app = app
-        self.last_event_time = {}
-        
-    def on_modified(self, event):
-        if event.is_directory:
-            return
-        
-        # Get the configured file extension
-        file_extension = self.app.config.get('file_extension', '.lpz')
-        if not file_extension.startswith('.'):
-            file_extension = '.' + file_extension
-            
-        if event.src_path.endswith(file_extension):
-            # Debounce events (ignore if same file modified within 3 seconds)
-            now = time.time()
-            if event.src_path in self.last_event_time:
-                if now - self.last_event_time[event.src_path] < 3:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Tray icon pre-rendered offline (64x64, blue square with white disc and a
+# blue G) and embedded as PNG so create_tray_icon just decodes it instead of
+# re-running ImageDraw primitives on every start
+_ICON_PNG = base64.b64decode(
+    b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAIAAAAlC+aJAAAAnklEQVR42u3ZyxGAIAwFQPpv'
+    b'Wu1A5RvCvuHEiT2QCaGUcm2+AAAAAAAAAAAAAACiAp5sBnhNXMCvxAJUJwSgMYsBXbIM0DEL'
+    b'AN0DMLjYDzMcCPhyiO/7zQaAuoMCTAFM6VXH1J+JtcglBgAY0cZVN396oUW99GyAB00AwPZv'
+    b'4gxTiQxzoQyTuQyz0STT6ST/A76YAAAAAAAAAAAAjgHcXOOdikgx+CMAAAAASUVORK5CYII='
+)
+
+# Built on first use by get_handler_class() so importing this module doesn't
+# pay for watchdog
+_handler_class = None
+
+
+def get_handler_class():
+    """Build (once) the watchdog handler class, importing watchdog lazily"""
+    global _handler_class
+    if _handler_class is not None:
+        return _handler_class
+
+    from watchdog.events import PatternMatchingEventHandler
+
+    class FileExtensionHandler(PatternMatchingEventHandler):
+        """Handles file change events for specified extension
+
+        Filtering happens inside watchdog's pattern matcher before dispatch,
+        so events for other file types never reach Python-level handler code.
+        """
+
+        # Cap on the mtime dedup cache so a long session over a large tree
+        # can't grow it without bound
+        SEEN_CACHE_SIZE = 1024
+
+        # Adaptive debounce bounds (seconds): the window starts small, grows
+        # while events keep arriving, and shrinks back after quiet flushes,
+        # converging on the smallest window that still captures a save burst
+        DEBOUNCE_INITIAL = 0.5
+        DEBOUNCE_MIN = 0.25
+        DEBOUNCE_MAX = 5.0
+
+        def __init__(self, app, file_extension):
+            if not file_extension.startswith('.'):
+                file_extension = '.' + file_extension
+            super().__init__(patterns=[f'*{file_extension}'],
+                             ignore_directories=True,
+                             case_sensitive=False)
+            self.app = app
+            self.pending = set()
+            self._flush_id = None
+            self._debounce = self.DEBOUNCE_INITIAL
+            self._seen_mtimes = OrderedDict()  # path -> st_mtime_ns, LRU-evicted
+            # Precomputed suffixes for the dispatch fast path, in both str
+            # and bytes form so emitters that deliver raw bytes paths skip
+            # the UTF-8 decode for non-matching events
+            self._suffix = file_extension.lower()
+            self._suffix_bytes = os.fsencode(self._suffix)
+
+        def dispatch(self, event):
+            # Cheap suffix test before the fnmatch pattern machinery: during
+            # an editor save storm most events are for other files, and a
+            # single endswith rejects them without pattern matching the
+            # whole path
+            src = getattr(event, 'src_path', '') or ''
+            if isinstance(src, bytes):
+                if not src.lower().endswith(self._suffix_bytes):
                     return
-            
-            self.last_event_time[event.src_path] = now
+            elif not src.lower().endswith(self._suffix):
+                return
+            super().dispatch(event)
+
+        def on_modified(self, event):
+            # Drop duplicate events for the same write: editors often emit
+            # several change notifications without the file content advancing,
+            # which an unchanged mtime detects without clock arithmetic
+            try:
+                mtime_ns = os.stat(event.src_path, follow_symlinks=False).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            if mtime_ns is not None:
+                if self._seen_mtimes.get(event.src_path) == mtime_ns:
+                    return
+                self._seen_mtimes[event.src_path] = mtime_ns
+                self._seen_mtimes.move_to_end(event.src_path)
+                if len(self._seen_mtimes) > self.SEEN_CACHE_SIZE:
+                    self._seen_mtimes.popitem(last=False)
+
             print(f"Detected change in: {event.src_path}")
-            
-            # Schedule the commit dialog on the main thread with file path captured
-            file_path = event.src_path
-            self.app.root.after(100, lambda fp=file_path: self.app.show_commit_dialog(fp))
+            self.pending.add(event.src_path)
+
+            # Trailing-edge debounce: reschedule the flush on every event so
+            # a burst of saves collapses into one commit dialog. While a
+            # flush is already pending the window grows (dynamic doubling,
+            # damped to 1.5x) so a sustained burst keeps batching instead of
+            # being split across commits
+            if self._flush_id is not None:
+                self._debounce = min(self._debounce * 1.5, self.DEBOUNCE_MAX)
+                try:
+                    self.app.root.after_cancel(self._flush_id)
+                except tk.TclError:
+                    pass
+            self._flush_id = self.app.root.after(
+                int(self._debounce * 1000), self._flush)
+
+        def _flush(self):
+            """Hand the accumulated batch of changed files to the app (main thread)"""
+            self._flush_id = None
+            if not self.pending:
+                return
+            file_paths = sorted(self.pending)
+            # Only remove the snapshot we took: the observer thread may have
+            # added more paths since, and clear() would silently drop them
+            self.pending.difference_update(file_paths)
+
+            # A single-file flush means the window was wider than the burst;
+            # shrink it so the next lone save waits less
+            if len(file_paths) == 1:
+                self._debounce = max(self._debounce / 2, self.DEBOUNCE_MIN)
+
+            self.app.show_commit_dialog(file_paths)
+
+    _handler_class = FileExtensionHandler
+    return _handler_class
+
+
+# Platform-specific process creation flags: detach from our session on POSIX
+# and suppress console window flicker on Windows
+if os.name == 'nt':
+    _POPEN_KWARGS = {'creationflags': subprocess.CREATE_NO_WINDOW}
+else:
+    _POPEN_KWARGS = {'start_new_session': True}
+
+
+def _git_env():
+    """Environment for git subprocesses: pin the locale so any output we do
+    inspect is stable, and skip optional index-refresh locking"""
+    env = dict(os.environ)
+    env['LC_ALL'] = 'C'
+    env['GIT_OPTIONAL_LOCKS'] = '0'
+    return env
+
+
+class GitWorker:
+    """Serializes git operations for one repository on a single event loop.
+
+    Tray actions and file-change commits post jobs here instead of spawning a
+    fresh thread per operation, so rapid events queue up behind each other
+    rather than fighting over .git/index.lock. Jobs run on one asyncio loop
+    hosted by a single daemon thread; subprocesses use
+    asyncio.create_subprocess_exec so no thread is churned per git call and
+    timeouts are uniform via asyncio.wait_for.
+    """
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self._repo = None  # cached pygit2.Repository, opened lazily
+        self._pending_keys = set()  # dedup keys of queued/running ops
+        self.loop = asyncio.new_event_loop()
+        self._lock = asyncio.Lock()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, job, *args, key=None, **kwargs):
+        """Schedule a coroutine (or plain callable) on the worker loop.
+
+        Returns a concurrent.futures.Future with the job's result. Jobs are
+        serialized through an asyncio.Lock - the worker behaves like a
+        single-slot pool, which is what one repository can use anyway given
+        .git/index.lock. When a dedup `key` is given and an operation with
+        the same key is already queued or running, returns None instead of
+        piling up duplicates from rapid tray clicks.
+        """
+        if key is not None:
+            if key in self._pending_keys:
+                return None
+            self._pending_keys.add(key)
+
+        if asyncio.iscoroutine(job):
+            coro = job
+        elif asyncio.iscoroutinefunction(job):
+            coro = job(*args, **kwargs)
+        else:
+            async def _call():
+                return job(*args, **kwargs)
+            coro = _call()
+
+        async def _serialized():
+            async with self._lock:
+                return await coro
+
+        future = asyncio.run_coroutine_threadsafe(_serialized(), self.loop)
+        if key is not None:
+            future.add_done_callback(lambda f: self._pending_keys.discard(key))
+        return future
+
+    async def run_git(self, *args, timeout=30):
+        """Run one git command via the loop's subprocess transport.
+
+        Returns a CompletedProcess so callers keep the familiar
+        returncode/stdout/stderr interface.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            'git', *args,
+            cwd=self.repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_git_env(),
+            **_POPEN_KWARGS
+        )
+        try:
+            out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(['git'] + list(args), timeout)
+        return subprocess.CompletedProcess(
+            ['git'] + list(args), proc.returncode,
+            out.decode(errors='replace'), err.decode(errors='replace')
+        )
+
+    def get_repo(self):
+        """Open (once) and cache the pygit2 Repository for this path.
+
+        Returns None when pygit2 is not installed. Caching keeps libgit2's
+        index memory-maps alive across calls.
+        """
+        if pygit2 is None:
+            return None
+        if self._repo is None:
+            self._repo = pygit2.Repository(self.repo_path)
+        return self._repo
+
+    async def fetch_async(self, remote_name='origin', timeout=30):
+        """Run the in-process fetch off-loop with the standard timeout.
+
+        The libgit2 fetch is a blocking network call; executed directly on
+        the worker loop a stalled remote would wedge every queued operation
+        behind the serialization lock with no way for a timeout to fire. It
+        runs on an executor thread instead, bounded by asyncio.wait_for like
+        every subprocess git op. Returns None when pygit2 is unavailable or
+        the fetch timed out, so the caller falls back to `git fetch`.
+        """
+        if pygit2 is None:
+            return None
+        try:
+            return await asyncio.wait_for(
+                self.loop.run_in_executor(None, self.fetch_in_process,
+                                          remote_name),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            print("In-process fetch timed out, falling back to git binary")
+            return None
+
+    def fetch_in_process(self, remote_name='origin'):
+        """Fetch via pygit2 without spawning the git binary.
+
+        Returns a CompletedProcess-shaped result so callers can share the
+        returncode/stdout handling with the subprocess path, or None when
+        pygit2 is unavailable (caller falls back to `git fetch`).
+        """
+        try:
+            repo = self.get_repo()
+            if repo is None:
+                return None
+            stats = repo.remotes[remote_name].fetch()
+        except Exception as e:
+            print(f"In-process fetch failed, falling back to git binary: {e}")
+            return None
+
+        if stats.received_objects:
+            summary = f"Received {stats.received_objects} objects from {remote_name}"
+        else:
+            summary = ''
+        return subprocess.CompletedProcess(
+            ['pygit2', 'fetch', remote_name], 0, summary, '')
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self):
+        """Shut down the worker loop"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._repo = None
 
 
 class GitAutoSyncApp:
@@ -72,14 +346,25 @@ class GitAutoSyncApp:
         # Configuration
         self.config_file = "git_sync_config.json"
         self.config = self.load_config()
+        self._config_dirty = False
         
-        # File monitoring
+        # File monitoring. The Observer thread is created once and reused;
+        # watches are (un)scheduled on it rather than tearing the thread down
         self.observer = None
+        self._watch_key = None  # (path, recursive, extension) currently watched
         self.monitoring = False
         self.active_dialog = None  # Track active commit dialog
         
         # System tray
         self.tray_icon = None
+
+        # Background git worker (created lazily once a repo is configured)
+        self.git_worker = None
+
+        # Queue of UI callables posted from background threads; drained
+        # periodically on the Tk main thread so no other thread ever touches
+        # a widget directly
+        self._tk_q = queue.Queue()
         
         # Setup GUI
         self.setup_main_gui()
@@ -91,10 +376,49 @@ class GitAutoSyncApp:
             self.remote_var.set(self.config.get('default_remote', 'origin'))
             self.branch_var.set(self.config.get('default_branch', 'main'))
             self.extension_var.set(self.config.get('file_extension', '.lpz'))
+            self.recursive_var.set(self.config.get('watch_recursive', True))
+            self.skip_hooks_var.set(self.config.get('skip_hooks', True))
         
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        # Start draining queued UI tasks
+        self.root.after(50, self._drain_tk_queue)
         
+    def post_to_main(self, fn):
+        """Schedule a callable to run on the Tk main thread.
+
+        Safe to call from any thread (worker loop, pystray, watchdog).
+        """
+        self._tk_q.put(fn)
+
+    def _drain_tk_queue(self):
+        """Run queued UI tasks on the main thread, then reschedule"""
+        try:
+            while True:
+                fn = self._tk_q.get_nowait()
+                try:
+                    fn()
+                except Exception as e:
+                    print(f"Error in queued UI task: {e}")
+        except queue.Empty:
+            pass
+        # quit_app may run inside fn() above and destroy the root; stop the
+        # drain loop quietly instead of rescheduling on a dead interpreter
+        try:
+            self.root.after(50, self._drain_tk_queue)
+        except tk.TclError:
+            return
+
+    def get_git_worker(self):
+        """Get the persistent git worker for the configured repository"""
+        repo_path = self.config['repo_path']
+        if self.git_worker is None or self.git_worker.repo_path != repo_path:
+            if self.git_worker:
+                self.git_worker.stop()
+            self.git_worker = GitWorker(repo_path)
+        return self.git_worker
+
     def load_config(self):
         """Load configuration from JSON file"""
         try:
@@ -106,10 +430,25 @@ class GitAutoSyncApp:
         return {}
     
     def save_config(self):
-        """Save configuration to JSON file"""
+        """Schedule a config write; repeated calls coalesce into one flush"""
+        if not self._config_dirty:
+            self._config_dirty = True
+            self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Write the config atomically: temp file, single write, os.replace"""
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        tmp = self.config_file + '.tmp'
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = json.dumps(self.config, indent=2).encode()
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.config_file)
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -162,8 +501,24 @@ class GitAutoSyncApp:
         # Default Remote
         ttk.Label(main_frame, text="🔗 Default Remote:").grid(row=4, column=0, sticky=tk.W, pady=5)
         self.remote_var = tk.StringVar(value="origin")
-        ttk.Entry(main_frame, textvariable=self.remote_var, width=20).grid(row=4, column=1, 
+        ttk.Entry(main_frame, textvariable=self.remote_var, width=20).grid(row=4, column=1,
                                                                           sticky=tk.W, padx=(10, 5), pady=5)
+
+        # Watch subdirectories (recursive monitoring)
+        self.recursive_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(main_frame, text="Watch subdirectories",
+                       variable=self.recursive_var).grid(row=4, column=2, sticky=tk.W, pady=5)
+
+        # Skip hooks on auto-sync commits/pushes. Hooks and auto-gc can add
+        # hundreds of ms per save on large repos; users relying on
+        # pre-commit checks can turn them back on
+        self.skip_hooks_var = tk.BooleanVar(value=True)
+        skip_frame = ttk.Frame(main_frame)
+        skip_frame.grid(row=5, column=2, sticky=tk.W, pady=5)
+        ttk.Checkbutton(skip_frame, text="Skip git hooks",
+                       variable=self.skip_hooks_var).pack(anchor=tk.W)
+        ttk.Label(skip_frame, text="(faster, but pre-commit checks won't run)",
+                 font=('Arial', 8), foreground='gray').pack(anchor=tk.W)
         
         # Default Branch
         ttk.Label(main_frame, text="🌿 Default Branch:").grid(row=5, column=0, sticky=tk.W, pady=5)
@@ -196,6 +551,17 @@ class GitAutoSyncApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
+
+        # Reusable notification window for non-error tray messages - built
+        # once here so show_tray_message only updates a label instead of
+        # creating and destroying a widget tree per message
+        self._notif = tk.Toplevel(self.root)
+        self._notif.withdraw()
+        self._notif.attributes('-topmost', True)
+        self._notif_label = ttk.Label(self._notif, text='', font=('Arial', 10),
+                                      padding="15")
+        self._notif_label.pack()
+        self._notif_after = None
         
     def browse_watch_path(self):
         """Browse for watch directory"""
@@ -232,15 +598,21 @@ class GitAutoSyncApp:
             messagebox.showerror("Error", "Please enter a valid file extension (e.g., .lpz, .txt, .py)")
             return
             
-        if not os.path.exists(watch_path):
-            messagebox.showerror("Error", f"Watch path does not exist: {watch_path}")
-            return
-            
-        if not os.path.exists(repo_path):
-            messagebox.showerror("Error", f"Repository path does not exist: {repo_path}")
-            return
-            
-        if not os.path.exists(os.path.join(repo_path, '.git')):
+        # One stat per path instead of repeated exists checks - noticeable
+        # on network shares
+        for label, path in (("Watch path", watch_path),
+                            ("Repository path", repo_path)):
+            try:
+                os.stat(path)
+            except OSError:
+                messagebox.showerror("Error", f"{label} does not exist: {path}")
+                return
+
+        # .git is a directory in a normal clone but a pointer file in a git
+        # worktree; a single stat accepts both
+        try:
+            os.stat(os.path.join(repo_path, '.git'))
+        except OSError:
             messagebox.showerror("Error", f"Not a Git repository: {repo_path}")
             return
         
@@ -250,20 +622,36 @@ class GitAutoSyncApp:
             'repo_path': repo_path,
             'file_extension': file_extension,
             'default_remote': self.remote_var.get(),
-            'default_branch': self.branch_var.get()
+            'default_branch': self.branch_var.get(),
+            'watch_recursive': self.recursive_var.get(),
+            'skip_hooks': self.skip_hooks_var.get()
         })
         self.save_config()
-        
-        # Start monitoring
+
+        # Start monitoring (watchdog is only imported here, on first use)
         try:
-            if self.observer:
-                self.observer.stop()
-                
-            self.observer = Observer()
-            event_handler = FileExtensionHandler(self)
-            self.observer.schedule(event_handler, watch_path, recursive=True)
-            self.observer.start()
-            
+            from watchdog.observers import Observer
+
+            if self.observer is None:
+                self.observer = Observer()
+                self.observer.start()
+
+            # Rescheduling is cheap; tearing down the observer thread and
+            # its inotify watches is not, so reuse it across restarts and
+            # no-op when the watch configuration hasn't changed
+            watch_key = (watch_path, self.recursive_var.get(), file_extension)
+            if not (self.monitoring and self._watch_key == watch_key):
+                self.observer.unschedule_all()
+                # Nothing is watched from here until schedule() succeeds, so
+                # drop the key now: if schedule() raises (e.g. inotify limits
+                # on a large recursive tree) a retry must not hit the no-op
+                # branch above and claim monitoring is active
+                self._watch_key = None
+                event_handler = get_handler_class()(self, file_extension)
+                self.observer.schedule(event_handler, watch_path,
+                                       recursive=self.recursive_var.get())
+                self._watch_key = watch_key
+
             self.monitoring = True
             self.status_var.set(f"✅ Monitoring {file_extension} files in: {watch_path}")
             
@@ -275,18 +663,18 @@ class GitAutoSyncApp:
             messagebox.showinfo("Success", f"✅ Now monitoring {file_extension} files!\n\nPath: {watch_path}\n\nYou can now minimize to tray or continue working.")
             
         except Exception as e:
+            self.monitoring = False
             messagebox.showerror("Error", f"Failed to start monitoring: {e}")
-    
+
     def stop_monitoring(self):
-        """Stop file monitoring"""
+        """Stop file monitoring (the observer thread stays warm for restart)"""
         try:
             if self.observer and self.observer.is_alive():
                 print("Stopping file monitoring...")
-                self.observer.stop()
-                self.observer.join(timeout=5)  # Wait up to 5 seconds
-                self.observer = None
+                self.observer.unschedule_all()
+                self._watch_key = None
                 print("File monitoring stopped successfully")
-            
+
             self.monitoring = False
             file_ext = self.config.get('file_extension', '.lpz')
             self.status_var.set(f"Monitoring stopped. Ready to monitor {file_ext} files again.")
@@ -305,8 +693,11 @@ class GitAutoSyncApp:
             if hasattr(self, 'root') and self.root.winfo_exists():
                 messagebox.showerror("Error", f"Failed to stop monitoring: {e}")
     
-    def show_commit_dialog(self, file_path):
-        """Show commit dialog when file changes"""
+    def show_commit_dialog(self, file_paths):
+        """Show commit dialog for a batch of changed files"""
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+
         # Prevent multiple dialogs
         if self.active_dialog:
             try:
@@ -316,24 +707,24 @@ class GitAutoSyncApp:
             except tk.TclError:
                 # Dialog no longer exists, clear reference
                 self.active_dialog = None
-        
-        print(f"Creating commit dialog for: {os.path.basename(file_path)}")
-            
+
+        print(f"Creating commit dialog for {len(file_paths)} file(s)")
+
         try:
             # Create dialog with proper error handling
             if not self.root.winfo_viewable():
                 # Main window is hidden, create independent dialog
-                dialog_obj = CommitDialog(None, self, file_path)
+                dialog_obj = CommitDialog(None, self, file_paths)
                 self.active_dialog = dialog_obj.dialog
             else:
                 # Main window is visible, use it as parent
-                dialog_obj = CommitDialog(self.root, self, file_path)
+                dialog_obj = CommitDialog(self.root, self, file_paths)
                 self.active_dialog = dialog_obj.dialog
         except Exception as e:
             print(f"Error creating commit dialog: {e}")
             # Try again with no parent as fallback
             try:
-                dialog_obj = CommitDialog(None, self, file_path)
+                dialog_obj = CommitDialog(None, self, file_paths)
                 self.active_dialog = dialog_obj.dialog
             except Exception as e2:
                 print(f"Failed to create commit dialog: {e2}")
@@ -353,19 +744,25 @@ class GitAutoSyncApp:
         
     def create_tray_icon(self):
         """Create system tray icon"""
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='blue')
-        draw = ImageDraw.Draw(image)
-        draw.ellipse([16, 16, 48, 48], fill='white')
-        draw.text((28, 26), "G", fill='blue')
+        # Deferred imports: pystray and PIL are only needed once the user
+        # actually minimizes to the tray
+        import pystray
+        from PIL import Image
+
+        # Decode the pre-rendered icon instead of drawing it from scratch
+        image = Image.open(io.BytesIO(_ICON_PNG))
         
-        # Create menu
+        # Create menu. pystray invokes callbacks on its own thread, so each
+        # one is marshalled onto the Tk main thread before touching widgets
+        def on_main(handler):
+            return lambda icon, item: self.post_to_main(handler)
+
         menu = pystray.Menu(
-            pystray.MenuItem("🛠 Open Config", self.show_main_window),
-            pystray.MenuItem("🔄 Force Push Now", self.force_push),
-            pystray.MenuItem("⬇️ Git Pull", self.git_pull),
-            pystray.MenuItem("🔃 Git Fetch", self.git_fetch),
-            pystray.MenuItem("❌ Exit", self.quit_app)
+            pystray.MenuItem("🛠 Open Config", on_main(self.show_main_window)),
+            pystray.MenuItem("🔄 Force Push Now", on_main(self.force_push)),
+            pystray.MenuItem("⬇️ Git Pull", on_main(self.git_pull)),
+            pystray.MenuItem("🔃 Git Fetch", on_main(self.git_fetch)),
+            pystray.MenuItem("❌ Exit", on_main(self.quit_app))
         )
         
         self.tray_icon = pystray.Icon("git_sync", image, "Git Auto-Sync Monitor", menu)
@@ -397,26 +794,35 @@ class GitAutoSyncApp:
             return
         
         def run_push():
+            return self.run_git_commands(
+                self.config['repo_path'],
+                "Manual push from tray",
+                self.config.get('default_remote', 'origin'),
+                self.config.get('default_branch', 'main')
+            )
+
+        def on_done(future):
             try:
-                success = self.run_git_commands(
-                    self.config['repo_path'],
-                    "Manual push from tray",
-                    self.config.get('default_remote', 'origin'),
-                    self.config.get('default_branch', 'main')
-                )
-                
+                success = future.result()
                 if success:
-                    self.root.after(0, lambda: self.show_tray_message("Success", "✅ Force push completed successfully!"))
+                    self.post_to_main(lambda: self.show_tray_message("Success", "✅ Force push completed successfully!"))
                 else:
-                    self.root.after(0, lambda: self.show_tray_message("Error", "❌ Force push failed. Check console for details."))
-                    
+                    self.post_to_main(lambda: self.show_tray_message("Error", "❌ Force push failed. Check console for details."))
             except Exception as e:
                 print(f"Force push failed: {e}")
-                self.root.after(0, lambda: self.show_tray_message("Error", f"❌ Force push error: {str(e)}"))
-        
-        # Show initial message and run in background
+                # Bind the text now - the except variable is unbound by the
+                # time the queued lambda runs
+                error_msg = f"❌ Force push error: {e}"
+                self.post_to_main(lambda: self.show_tray_message("Error", error_msg))
+
+        # Queue on the persistent worker; duplicate clicks while a push is
+        # still queued or running are dropped instead of stacking up
+        future = self.get_git_worker().submit(run_push, key='push')
+        if future is None:
+            self.show_tray_message("Info", "⏳ A push is already in progress")
+            return
         self.show_tray_message("Info", "🔄 Force pushing changes...")
-        threading.Thread(target=run_push, daemon=True).start()
+        future.add_done_callback(on_done)
             
     def git_pull(self, icon=None, item=None):
         """Perform git pull"""
@@ -424,42 +830,48 @@ class GitAutoSyncApp:
             self.show_tray_message("Error", "❌ No repository configured")
             return
         
-        def run_pull():
+        worker = self.get_git_worker()
+
+        async def run_pull():
+            # --ff-only keeps the auto-sync tree linear; LC_ALL=C in the git
+            # env pins the one summary string we still look at
+            return await worker.run_git('-c', 'color.ui=never', 'pull', '--ff-only')
+
+        def on_done(future):
             try:
-                result = subprocess.run(
-                    ['git', 'pull'],
-                    cwd=self.config['repo_path'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
+                result = future.result()
+
                 if result.returncode == 0:
-                    if "Already up to date" in result.stdout or "Already up-to-date" in result.stdout:
+                    if "Already up to date" in result.stdout:
                         message = "✅ Repository is already up to date"
-                    elif "Fast-forward" in result.stdout or "files changed" in result.stdout:
-                        message = "✅ Pull completed - repository updated!"
                     else:
-                        message = "✅ Pull completed successfully"
-                    
-                    self.root.after(0, lambda: self.show_tray_message("Git Pull", message))
+                        message = "✅ Pull completed - repository updated!"
+
+                    self.post_to_main(lambda: self.show_tray_message("Git Pull", message))
                 else:
                     error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                    self.root.after(0, lambda: self.show_tray_message("Error", f"❌ Pull failed: {error_msg}"))
-                
+                    self.post_to_main(lambda: self.show_tray_message("Error", f"❌ Pull failed: {error_msg}"))
+
                 print(f"Git pull result: {result.stdout}")
                 if result.stderr:
                     print(f"Git pull error: {result.stderr}")
-                    
+
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self.show_tray_message("Error", "❌ Pull timed out (>30 seconds)"))
+                self.post_to_main(lambda: self.show_tray_message("Error", "❌ Pull timed out (>30 seconds)"))
             except Exception as e:
                 print(f"Git pull failed: {e}")
-                self.root.after(0, lambda: self.show_tray_message("Error", f"❌ Pull error: {str(e)}"))
-        
-        # Show initial message and run in background
+                # Bind the text now - the except variable is unbound by the
+                # time the queued lambda runs
+                error_msg = f"❌ Pull error: {e}"
+                self.post_to_main(lambda: self.show_tray_message("Error", error_msg))
+
+        # Queue on the persistent worker, dropping duplicate clicks
+        future = worker.submit(run_pull, key='pull')
+        if future is None:
+            self.show_tray_message("Info", "⏳ A pull is already in progress")
+            return
         self.show_tray_message("Info", "🔄 Pulling latest changes...")
-        threading.Thread(target=run_pull, daemon=True).start()
+        future.add_done_callback(on_done)
             
     def git_fetch(self, icon=None, item=None):
         """Perform git fetch"""
@@ -467,79 +879,212 @@ class GitAutoSyncApp:
             self.show_tray_message("Error", "❌ No repository configured")
             return
         
-        def run_fetch():
+        worker = self.get_git_worker()
+        remote = self.config.get('default_remote', 'origin')
+
+        async def run_fetch():
+            result = await worker.fetch_async(remote)
+            if result is None:
+                # --porcelain (git >= 2.41) emits one machine-readable line
+                # per updated ref on stdout; fall back for older gits, whose
+                # human-format updates land on stderr instead
+                result = await worker.run_git('fetch', '--porcelain')
+                if result.returncode != 0 and 'porcelain' in result.stderr:
+                    result = await worker.run_git('fetch')
+                    if result.returncode == 0 and not result.stdout.strip():
+                        result = subprocess.CompletedProcess(
+                            result.args, 0, result.stderr, '')
+            return result
+
+        def on_done(future):
             try:
-                result = subprocess.run(
-                    ['git', 'fetch'],
-                    cwd=self.config['repo_path'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
+                result = future.result()
+
                 if result.returncode == 0:
                     if result.stdout.strip():
                         message = "✅ Fetch completed - new changes available"
                     else:
                         message = "✅ Fetch completed - no new changes"
-                    
-                    self.root.after(0, lambda: self.show_tray_message("Git Fetch", message))
+
+                    self.post_to_main(lambda: self.show_tray_message("Git Fetch", message))
                 else:
                     error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                    self.root.after(0, lambda: self.show_tray_message("Error", f"❌ Fetch failed: {error_msg}"))
-                
+                    self.post_to_main(lambda: self.show_tray_message("Error", f"❌ Fetch failed: {error_msg}"))
+
                 print(f"Git fetch result: {result.stdout}")
                 if result.stderr:
                     print(f"Git fetch error: {result.stderr}")
-                    
+
             except subprocess.TimeoutExpired:
-                self.root.after(0, lambda: self.show_tray_message("Error", "❌ Fetch timed out (>30 seconds)"))
+                self.post_to_main(lambda: self.show_tray_message("Error", "❌ Fetch timed out (>30 seconds)"))
             except Exception as e:
                 print(f"Git fetch failed: {e}")
-                self.root.after(0, lambda: self.show_tray_message("Error", f"❌ Fetch error: {str(e)}"))
-        
-        # Show initial message and run in background
+                # Bind the text now - the except variable is unbound by the
+                # time the queued lambda runs
+                error_msg = f"❌ Fetch error: {e}"
+                self.post_to_main(lambda: self.show_tray_message("Error", error_msg))
+
+        # Queue on the persistent worker, dropping duplicate clicks
+        future = worker.submit(run_fetch, key='fetch')
+        if future is None:
+            self.show_tray_message("Info", "⏳ A fetch is already in progress")
+            return
         self.show_tray_message("Info", "🔄 Fetching latest changes...")
-        threading.Thread(target=run_fetch, daemon=True).start()
+        future.add_done_callback(on_done)
     
     def show_tray_message(self, title, message):
-        """Show popup message for tray operations"""
-        # Create a temporary window to ensure messagebox appears on top
-        temp = tk.Toplevel()
-        temp.withdraw()
-        temp.attributes('-topmost', True)
-        
-        # Determine message type and show appropriate dialog
+        """Show a notification for tray operations (main thread only)"""
+        # Errors stay modal so the user can't miss them. Parent them to the
+        # always-topmost notification window, not self.root - in tray mode
+        # the root is withdrawn and the box could open behind other windows
         if title == "Error" or "❌" in message:
-            messagebox.showerror(title, message, parent=temp)
-        elif title == "Success" or "✅" in message:
-            messagebox.showinfo(title, message, parent=temp)
-        else:
-            messagebox.showinfo(title, message, parent=temp)
-        
-        temp.destroy()
+            messagebox.showerror(title, message, parent=self._notif)
+            return
+
+        # Everything else reuses the pre-built notification window
+        self._notif.title(title)
+        self._notif_label.config(text=message)
+        if self._notif_after is not None:
+            self._notif.after_cancel(self._notif_after)
+        self._notif.deiconify()
+        self._notif.lift()
+        self._notif_after = self._notif.after(2500, self._hide_notification)
+
+    def _hide_notification(self):
+        """Withdraw the notification window after its display timeout"""
+        self._notif_after = None
+        self._notif.withdraw()
     
-    def run_git_commands(self, repo_path, commit_message, remote, branch):
-        """Run git add, commit, and push commands"""
+    def run_git_commands(self, repo_path, commit_message, remote, branch, file_paths=None):
+        """Run git add, commit, and push as a single chained invocation
+
+        When file_paths is given, only those paths are staged (explicit
+        pathspec) so git doesn't re-walk the whole working tree.
+        """
         try:
-            # Git add
-            subprocess.run(['git', 'add', '.'], cwd=repo_path, check=True)
-            
-            # Git commit
-            subprocess.run(['git', 'commit', '-m', commit_message], cwd=repo_path, check=True)
-            
-            # Git push
-            subprocess.run(['git', 'push', remote, branch], cwd=repo_path, check=True)
-            
+            if file_paths:
+                add_args = ['--'] + list(file_paths)
+            else:
+                add_args = ['.']
+
+            # Probe before mining: a cheap status check skips the whole
+            # add/commit/push sequence when the change was a no-op write
+            # (editors often write-then-compare). Untracked files are still
+            # listed so a brand-new file doesn't get skipped.
+            status_cmd = ['git', 'status', '--porcelain=v2', '-z']
+            if file_paths:
+                status_cmd += ['--'] + list(file_paths)
+            probe = subprocess.run(status_cmd, cwd=repo_path,
+                                   capture_output=True, text=True,
+                                   timeout=30, env=_git_env(),
+                                   **_POPEN_KWARGS)
+            if probe.returncode == 0 and not probe.stdout.strip('\0 \n'):
+                print("No changes detected - nothing to commit")
+                return True
+
+            # When enabled (the default for an auto-sync tool), skip hook
+            # execution and background gc on these machine-generated commits
+            skip_hooks = self.config.get('skip_hooks', True)
+            commit_cmd = ['git']
+            if skip_hooks:
+                commit_cmd += ['-c', 'gc.auto=0', '-c', 'core.fsmonitor=false']
+            commit_cmd += ['commit']
+            if skip_hooks:
+                commit_cmd += ['--no-verify']
+            commit_cmd += ['-m', commit_message]
+
+            # Stage and commit first (bounded output, safe to buffer); the
+            # push is run separately below so its progress can be streamed
+            if os.name == 'nt':
+                # cmd.exe quoting rules differ from POSIX shells, so keep the
+                # safe sequential path on Windows
+                commands = [['git', 'add'] + add_args, commit_cmd]
+                shell = False
+            else:
+                # One shell invocation instead of two separate processes -
+                # saves the fork/exec overhead per step
+                commands = [(
+                    f"git add {' '.join(shlex.quote(a) for a in add_args)} && "
+                    f"{' '.join(shlex.quote(a) for a in commit_cmd)}"
+                )]
+                shell = True
+
+            for cmd in commands:
+                # Popen + communicate blocks in os.read, which releases the
+                # GIL, so the watcher and tray threads stay responsive during
+                # a slow push
+                proc = subprocess.Popen(cmd, cwd=repo_path, shell=shell,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE,
+                                        text=True, env=_git_env(),
+                                        **_POPEN_KWARGS)
+                try:
+                    out, err = proc.communicate(timeout=30)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    print(f"Git command timed out: {cmd}")
+                    return False
+
+                if out:
+                    print(f"Git output: {out.strip()}")
+                if err:
+                    print(f"Git messages: {err.strip()}")
+
+                if proc.returncode != 0:
+                    print(f"Git command failed ({proc.returncode}): {cmd}")
+                    return False
+
+            if not self._stream_push(repo_path, remote, branch):
+                return False
+
             print(f"Successfully pushed changes: {commit_message}")
             return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"Git command failed: {e}")
-            return False
+
         except Exception as e:
             print(f"Unexpected error: {e}")
             return False
+
+    def _stream_push(self, repo_path, remote, branch, timeout=120):
+        """Run git push, streaming its output line by line.
+
+        Push output can be large for big pack uploads, so instead of
+        buffering it all with capture_output the lines are read as they
+        arrive, logged, and forwarded to the status bar. A watchdog timer
+        kills the process if the whole push exceeds the timeout.
+        """
+        push_cmd = ['git', '-c', 'color.ui=never',
+                    '-c', 'push.autoSetupRemote=true', 'push']
+        if self.config.get('skip_hooks', True):
+            push_cmd.append('--no-verify')
+        push_cmd += [remote, branch]
+
+        proc = subprocess.Popen(
+            push_cmd,
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            env=_git_env(),
+            **_POPEN_KWARGS
+        )
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if line:
+                    print(f"Git push: {line}")
+                    self.post_to_main(lambda l=line: self.status_var.set(l))
+            proc.wait()
+        finally:
+            timer.cancel()
+
+        if proc.returncode != 0:
+            print(f"Git push failed ({proc.returncode})")
+            return False
+        return True
     
     def on_closing(self):
         """Handle window close event"""
@@ -548,6 +1093,9 @@ class GitAutoSyncApp:
     
     def quit_app(self, icon=None, item=None):
         """Quit the application"""
+        # Persist any config change still waiting on its deferred flush
+        self._flush_config()
+
         # Close any active dialog
         if self.active_dialog:
             try:
@@ -559,7 +1107,17 @@ class GitAutoSyncApp:
         # Stop monitoring properly
         if self.monitoring:
             self.stop_monitoring()
-            
+
+        # The observer thread itself is only torn down here, on exit
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+            self.observer = None
+
+        if self.git_worker:
+            self.git_worker.stop()
+            self.git_worker = None
+
         if self.tray_icon:
             self.tray_icon.stop()
             self.tray_icon = None
@@ -575,9 +1133,18 @@ class GitAutoSyncApp:
 class CommitDialog:
     """Dialog for entering commit information - SIMPLIFIED VERSION"""
     
-    def __init__(self, parent, app, file_path):
+    def __init__(self, parent, app, file_paths):
         self.app = app
-        self.file_path = file_path
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        self.file_paths = file_paths
+
+        # Computed once; reused for the header label and the default commit
+        # message instead of re-deriving basenames in setup
+        if len(self.file_paths) == 1:
+            self.changed_desc = os.path.basename(self.file_paths[0])
+        else:
+            self.changed_desc = f"{len(self.file_paths)} files"
         
         # Create dialog - handle case where parent might be None
         if parent is None:
@@ -639,15 +1206,15 @@ class CommitDialog:
 
     def setup_simple_dialog(self):
         """Setup ONLY commit message - NO remote/branch fields"""
-        # Clear any existing widgets first
-        for widget in self.dialog.winfo_children():
-            widget.destroy()
-            
         main_frame = ttk.Frame(self.dialog, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        
+
         # File info
-        ttk.Label(main_frame, text=f"File changed: {os.path.basename(self.file_path)}", 
+        if len(self.file_paths) == 1:
+            changed_text = f"File changed: {self.changed_desc}"
+        else:
+            changed_text = f"{self.changed_desc} changed"
+        ttk.Label(main_frame, text=changed_text,
                  font=('Arial', 10, 'bold')).pack(pady=(0, 10))
         
         # ONLY commit message field
@@ -670,8 +1237,8 @@ class CommitDialog:
         self.commit_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Insert default text
-        default_commit = f"Update {os.path.basename(self.file_path)} - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        # Insert default text (f-string formatting skips the strftime call)
+        default_commit = f"Update {self.changed_desc} - {datetime.now():%Y-%m-%d %H:%M}"
         self.commit_text.insert('1.0', default_commit)
         
         # Buttons - NO OTHER FIELDS
@@ -716,17 +1283,31 @@ class CommitDialog:
         # Disable dialog while processing
         self.commit_text.configure(state='disabled')
         
-        # Run git commands in background
+        # Run git commands on the persistent worker
         def run_git():
-            success = self.app.run_git_commands(
+            return self.app.run_git_commands(
                 self.app.config['repo_path'],
                 commit_msg,
                 remote,
-                branch
+                branch,
+                file_paths=self.file_paths
             )
-            self.app.root.after(0, lambda: self.show_result(success, commit_msg))
-        
-        threading.Thread(target=run_git, daemon=True).start()
+
+        def on_done(future):
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"Git commands failed: {e}")
+                success = False
+            self.app.post_to_main(lambda: self.show_result(success, commit_msg))
+
+        future = self.app.get_git_worker().submit(run_git, key='push')
+        if future is None:
+            self.commit_text.configure(state='normal')
+            messagebox.showerror("Error",
+                                 "A push is already in progress - please try again shortly")
+            return
+        future.add_done_callback(on_done)
     
     def show_result(self, success, commit_msg):
         """Show result message"""